@@ -9,8 +9,6 @@ from firecrawl import AsyncFirecrawlApp
 from pydantic import BaseModel, Field
 from typing import Any, Optional, List
 from datetime import datetime 
-import io 
-import zipfile 
 #
 
 from utils.utils import clone_repo, summarize_codebase, cleanup_repo
@@ -19,8 +17,10 @@ from utils.gemini_helpers import (
     generate_all_difficulty_tasks,
     extract_technologies_from_digest
 )
-from utils.scraper import get_trending_repos
+from utils.scraper import get_trending_repos_multi, SINCE_OPTIONS
 from utils.utils import remove_emojis, append_auto_helpful_links
+from utils.export import EXPORT_FORMATS, export_tasks, export_file_extension, get_cached_archive
+from utils.task_store import TaskStore, DEFAULT_TASK_STORE_PATH
 
 from dotenv import load_dotenv
 load_dotenv()
@@ -29,6 +29,10 @@ st.set_page_config(layout="wide", page_title="Repo Task Generator")
 st.title("GitHub Repo Learning Task Generator")
 st.markdown("Generate detailed learning tasks and insights for any GitHub repository or job description.")
 
+st.sidebar.header("Export Settings")
+export_format = st.sidebar.selectbox("Bulk task export format:", options=list(EXPORT_FORMATS.keys()), index=0)
+export_compresslevel = st.sidebar.slider("ZIP compression level:", min_value=0, max_value=9, value=6)
+
 class NestedModel1(BaseModel):
     title: str
     company: Optional[str] = None
@@ -41,6 +45,38 @@ class NestedModel1(BaseModel):
 class ExtractSchema(BaseModel):
     job_descriptions: List[NestedModel1]
 
+def persist_generated_tasks(tasks):
+    try:
+        with TaskStore(DEFAULT_TASK_STORE_PATH) as store:
+            store.add_tasks(tasks)
+    except Exception as e:
+        st.warning(f"Could not save tasks to the local task store: {e}")
+
+def render_bulk_downloads(all_generated_tasks, processed_jds, zip_key):
+    st.download_button(
+        label=f"Download All Generated Tasks (Single {export_file_extension(export_format).upper()})",
+        data=export_tasks(all_generated_tasks, export_format),
+        file_name=f"all_job_tasks_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{export_file_extension(export_format)}",
+        mime=EXPORT_FORMATS[export_format],
+        key="download_all_tasks_single"
+    )
+
+    archive_data = get_cached_archive(
+        st.session_state,
+        all_generated_tasks,
+        processed_jds,
+        compresslevel=export_compresslevel,
+        pretty=(export_format == "json"),
+        cache_key=f"{zip_key}_archive"
+    )
+    st.download_button(
+        label="Download All Data (Tasks & JDs as ZIP)",
+        data=archive_data,
+        file_name=f"job_scraper_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip",
+        mime="application/zip",
+        key=zip_key
+    )
+
 def process_inputs_and_generate_tasks(repo_url_input, jd_txt_file, jd_csv_excel_file):
     repo_path = None
     try:
@@ -134,6 +170,7 @@ def process_inputs_and_generate_tasks(repo_url_input, jd_txt_file, jd_csv_excel_
                     st.markdown(f"**Estimated Time:** {task.get('estimated_time_hours', 'N/A')} hours")
                     st.markdown("---")
                     st.markdown(task.get("description", "No description available"))
+            persist_generated_tasks(tasks.values())
         
         if job_descriptions_to_process:
             all_generated_tasks = []
@@ -184,34 +221,8 @@ def process_inputs_and_generate_tasks(repo_url_input, jd_txt_file, jd_csv_excel_
             st.markdown("---")
 
             if all_generated_tasks:
-                all_tasks_json = json.dumps(all_generated_tasks, indent=2)
-                st.download_button(
-                    label="Download All Generated Tasks (Single JSON)",
-                    data=all_tasks_json,
-                    file_name=f"all_job_tasks_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                    mime="application/json",
-                    key="download_all_tasks_single"
-                )
-
-                zip_buffer = io.BytesIO()
-                with zipfile.ZipFile(zip_buffer, "a", zipfile.ZIP_DEFLATED, False) as zip_file:
-                    for i, jd in enumerate(job_descriptions_to_process):
-                        jd_title_safe = jd.get('title', f"Job_Description_{i+1}").replace(' ', '_').replace('/', '_')
-                        jd_filename = f"extracted_jd_{jd_title_safe}.json"
-                        zip_file.writestr(jd_filename, json.dumps(jd, indent=2))
-
-                    for task in all_generated_tasks:
-                        task_title_safe = task['title'].replace(' ', '_').replace('/', '_')
-                        task_filename = f"generated_task_{task_title_safe}_{task['difficulty']}.json"
-                        zip_file.writestr(task_filename, json.dumps(task, indent=2))
-                
-                st.download_button(
-                    label="Download All Data (Tasks & JDs as ZIP)",
-                    data=zip_buffer.getvalue(),
-                    file_name=f"job_scraper_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip",
-                    mime="application/zip",
-                    key="download_all_data_zip_from_file"
-                )
+                persist_generated_tasks(all_generated_tasks)
+                render_bulk_downloads(all_generated_tasks, job_descriptions_to_process, "download_all_data_zip_from_file")
 
     except Exception as e:
         st.error(f"An error occurred: {e}")
@@ -352,43 +363,20 @@ else:
                                     )
             
                     if all_generated_tasks:
-                        all_tasks_json = json.dumps(all_generated_tasks, indent=2)
-                        st.download_button(
-                            label="Download All Generated Tasks (Single JSON)",
-                            data=all_tasks_json,
-                            file_name=f"all_job_tasks_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                            mime="application/json",
-                            key="download_all_tasks_single"
-                        )
-
-                        zip_buffer = io.BytesIO()
-                        with zipfile.ZipFile(zip_buffer, "a", zipfile.ZIP_DEFLATED, False) as zip_file:
-                            processed_jds = [jd for jd in job_descriptions if len(jd.get('description', '')) > 500]
-                            for i, jd in enumerate(processed_jds):
-                                jd_title_safe = jd.get('title', f"Job_Description_{i+1}").replace(' ', '_').replace('/', '_')
-                                jd_filename = f"extracted_jd_{jd_title_safe}.json"
-                                zip_file.writestr(jd_filename, json.dumps(jd, indent=2))
-
-                            for task in all_generated_tasks:
-                                task_title_safe = task['title'].replace(' ', '_').replace('/', '_')
-                                task_filename = f"generated_task_{task_title_safe}_{task['difficulty']}.json"
-                                zip_file.writestr(task_filename, json.dumps(task, indent=2))
-                        
-                        st.download_button(
-                            label="Download All Data (Tasks & JDs as ZIP)",
-                            data=zip_buffer.getvalue(),
-                            file_name=f"job_scraper_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip",
-                            mime="application/zip",
-                            key="download_all_data_zip"
-                        )
+                        persist_generated_tasks(all_generated_tasks)
+                        processed_jds = [jd for jd in job_descriptions if len(jd.get('description', '')) > 500]
+                        render_bulk_downloads(all_generated_tasks, processed_jds, "download_all_data_zip")
             except Exception as e:
                 st.error(f"An error occurred during scraping or task generation: {e}")
 
 st.header("Explore Trending GitHub Repositories")
+trending_languages_input = st.text_input("Languages (comma-separated, leave empty for all):", key="trending_languages")
+trending_since = st.multiselect("Date ranges:", options=list(SINCE_OPTIONS), default=["daily"], key="trending_since")
 if st.button("Fetch Trending Repos"):
     with st.spinner("Fetching..."):
         try:
-            trending_repos = get_trending_repos()
+            trending_languages = [l.strip() for l in trending_languages_input.split(",") if l.strip()] or [None]
+            trending_repos = get_trending_repos_multi(trending_languages, trending_since or [None])
             st.session_state['trending_repos'] = trending_repos
         except Exception as e:
             st.error(f"Failed to fetch: {e}")
@@ -442,6 +430,7 @@ if 'trending_repos' in st.session_state and st.session_state['trending_repos']:
                     st.markdown(f"**Estimated Time:** {task.get('estimated_time_hours', 'N/A')} hours")
                     st.markdown("---")
                     st.markdown(task.get("description", "No description available"))
+            persist_generated_tasks(tasks.values())
         except Exception as e:
             st.error(f"Error: {e}")
         finally:
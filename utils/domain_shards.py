@@ -0,0 +1,94 @@
+import os
+import json
+
+INDEX_FILENAME = "index.json"
+
+
+def safe_domain_name(domain):
+    """Turns a free-form domain label into a filesystem-safe shard name."""
+    domain = "".join(c for c in (domain or "misc") if c.isalnum() or c in (' ', '.', '_')).strip()
+    domain = domain.replace(" ", "_")
+    return domain or "misc"
+
+
+class DomainShardWriter:
+    """
+    Routes tasks to append-only per-domain JSONL shards as they are produced.
+    Keeps one buffered file handle per domain and maintains an index file
+    mapping each domain to its shard and task count.
+    """
+
+    def __init__(self, output_dir, buffer_size=64 * 1024):
+        self.output_dir = output_dir
+        self.buffer_size = buffer_size
+        self._handles = {}
+        os.makedirs(output_dir, exist_ok=True)
+        self.index = load_domain_index(output_dir)
+
+    def write(self, task, source=None):
+        domain = safe_domain_name(task.get("domain", "misc"))
+        handle = self._handles.get(domain)
+        if handle is None:
+            filename = f"{domain}.jsonl"
+            handle = open(os.path.join(self.output_dir, filename), 'a', encoding='utf-8', buffering=self.buffer_size)
+            self._handles[domain] = handle
+            self.index.setdefault(domain, {"file": filename, "count": 0})
+
+        record = {"source": source, "task": task}
+        handle.write(json.dumps(record, separators=(',', ':')) + "\n")
+        self.index[domain]["count"] += 1
+        return domain
+
+    def write_repo_tasks(self, repo_result):
+        """Shards every generated task (easy/medium/hard) of a processed repo."""
+        tasks = repo_result.get("tasks") or {}
+        source = (repo_result.get("metadata") or {}).get("url")
+        written = 0
+        for task in tasks.values():
+            if not isinstance(task, dict) or "error_type" in task:
+                continue
+            self.write(task, source)
+            written += 1
+        return written
+
+    def close(self):
+        for handle in self._handles.values():
+            handle.close()
+        self._handles = {}
+
+        index_path = os.path.join(self.output_dir, INDEX_FILENAME)
+        tmp_path = index_path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.index, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, index_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def load_domain_index(output_dir):
+    index_path = os.path.join(output_dir, INDEX_FILENAME)
+    if not os.path.exists(index_path):
+        return {}
+    try:
+        with open(index_path, 'r') as f:
+            return json.load(f)
+    except json.JSONDecodeError:
+        print(f"Warning: could not decode shard index at {index_path}, starting a new one.")
+        return {}
+
+
+def iter_domain_tasks(output_dir, domain):
+    """Yields the tasks of a single domain without touching any other shard."""
+    entry = load_domain_index(output_dir).get(safe_domain_name(domain))
+    if not entry:
+        return
+    with open(os.path.join(output_dir, entry["file"]), 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            yield json.loads(line)["task"]
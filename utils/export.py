@@ -0,0 +1,81 @@
+import json
+import hashlib
+import tempfile
+import zipfile
+
+EXPORT_FORMATS = {
+    "json": "application/json",
+    "json-compact": "application/json",
+    "jsonl": "application/x-ndjson",
+}
+
+# Archives smaller than this stay in memory; larger ones roll over to a temp file.
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+
+def safe_filename(text):
+    return str(text).replace(' ', '_').replace('/', '_')
+
+
+def dump_json(obj, pretty=True):
+    if pretty:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(',', ':'))
+
+
+def export_tasks(tasks, fmt="json"):
+    """Serializes a list of tasks as pretty JSON, compact JSON or JSONL."""
+    if fmt == "jsonl":
+        return "".join(dump_json(task, pretty=False) + "\n" for task in tasks)
+    return dump_json(list(tasks), pretty=(fmt == "json"))
+
+
+def export_file_extension(fmt):
+    return "jsonl" if fmt == "jsonl" else "json"
+
+
+def tasks_fingerprint(tasks, jds=()):
+    """Cheap identity of a task set, used to decide whether an archive must be rebuilt."""
+    h = hashlib.sha1()
+    for task in tasks:
+        h.update(str(task.get('task_id', '')).encode())
+        h.update(str(task.get('last_updated', '')).encode())
+        h.update(str(len(task.get('description', ''))).encode())
+    h.update(str(len(jds)).encode())
+    return h.hexdigest()
+
+
+def build_export_archive(tasks, jds=(), compresslevel=6, pretty=True, spool_max_size=SPOOL_MAX_SIZE):
+    """
+    Streams JDs and tasks entry by entry into a spooled temp file and returns it rewound.
+    Only one entry is serialized in memory at a time.
+    """
+    compression = zipfile.ZIP_STORED if compresslevel == 0 else zipfile.ZIP_DEFLATED
+    spool = tempfile.SpooledTemporaryFile(max_size=spool_max_size)
+    with zipfile.ZipFile(spool, "w", compression, compresslevel=compresslevel or None) as zip_file:
+        for i, jd in enumerate(jds):
+            jd_title_safe = safe_filename(jd.get('title', f"Job_Description_{i+1}"))
+            zip_file.writestr(f"extracted_jd_{jd_title_safe}.json", dump_json(jd, pretty))
+
+        for task in tasks:
+            task_title_safe = safe_filename(task['title'])
+            zip_file.writestr(f"generated_task_{task_title_safe}_{task['difficulty']}.json", dump_json(task, pretty))
+    spool.seek(0)
+    return spool
+
+
+def get_cached_archive(cache, tasks, jds=(), compresslevel=6, pretty=True, cache_key="export_archive"):
+    """
+    Returns the archive bytes for this task set, rebuilding only when the tasks,
+    JDs or compression settings changed. `cache` is any dict-like store such as
+    st.session_state.
+    """
+    fingerprint = (tasks_fingerprint(tasks, jds), compresslevel, pretty)
+    cached = cache.get(cache_key)
+    if cached and cached[0] == fingerprint:
+        return cached[1]
+
+    with build_export_archive(tasks, jds, compresslevel, pretty) as spool:
+        data = spool.read()
+    cache[cache_key] = (fingerprint, data)
+    return data
@@ -5,7 +5,7 @@ import json
 from utils.utils import clone_repo, summarize_codebase, cleanup_repo
 from utils.gemini_helpers import generate_repo_insights, generate_all_difficulty_tasks
 
-def process_repositories(repos):
+def process_repositories(repos, sinks=()):
     results = []
     for repo in repos:
         repo_path = None 
@@ -25,6 +25,8 @@ def process_repositories(repos):
                 'tasks': tasks 
             }
             results.append(repo_result)
+            for sink in sinks:
+                sink.write_repo_tasks(repo_result)
         except Exception as e:
             print(f"Error processing {repo['title']}: {str(e)}")
             results.append({
@@ -1,16 +1,114 @@
+import os
+import json
+import time
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+TRENDING_URL = "https://github.com/trending"
+SINCE_OPTIONS = ("daily", "weekly", "monthly")
+REQUEST_TIMEOUT = (5, 20)
+HTTP_CACHE_DIR = os.getenv("HTTP_CACHE_DIR", os.path.join(os.getcwd(), ".http_cache"))
+# Cached pages younger than this are served without touching the network at all.
+HTTP_CACHE_FRESH_SECONDS = int(os.getenv("HTTP_CACHE_FRESH_SECONDS", "900"))
+
+_session = None
+
+
+def get_session():
+    """Returns a process-wide pooled session so repeated fetches reuse connections."""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        _session.headers.update({"User-Agent": "Mozilla/5.0"})
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=2)
+        _session.mount("https://", adapter)
+        _session.mount("http://", adapter)
+    return _session
+
+
+def _cache_paths(url, cache_dir):
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir, f"{key}.json"), os.path.join(cache_dir, f"{key}.html")
+
+
+def fetch_cached(url, params=None, cache_dir=HTTP_CACHE_DIR, fresh_seconds=HTTP_CACHE_FRESH_SECONDS, timeout=REQUEST_TIMEOUT):
+    """
+    GETs a page through an on-disk HTTP cache. Fresh entries are returned directly,
+    stale ones are revalidated with If-None-Match/If-Modified-Since.
+    """
+    full_url = requests.Request("GET", url, params=params).prepare().url
+    meta_path, body_path = _cache_paths(full_url, cache_dir)
+
+    meta = None
+    if os.path.exists(meta_path) and os.path.exists(body_path):
+        try:
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            meta = None
+
+    if meta and time.time() - meta.get("fetched_at", 0) < fresh_seconds:
+        with open(body_path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    headers = {}
+    if meta:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    resp = get_session().get(full_url, headers=headers, timeout=timeout)
+
+    if resp.status_code == 304 and meta:
+        meta["fetched_at"] = time.time()
+        _write_cache_meta(meta_path, meta)
+        with open(body_path, 'r', encoding='utf-8') as f:
+            return f.read()
 
-def get_trending_repos():
-    resp = requests.get("https://github.com/trending", headers={"User-Agent": "Mozilla/5.0"})
     if resp.status_code != 200:
         raise Exception(f"Failed: {resp.status_code}")
-    soup = BeautifulSoup(resp.text, "html.parser")
+
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(body_path, 'w', encoding='utf-8') as f:
+        f.write(resp.text)
+    _write_cache_meta(meta_path, {
+        "url": full_url,
+        "etag": resp.headers.get("ETag"),
+        "last_modified": resp.headers.get("Last-Modified"),
+        "fetched_at": time.time(),
+    })
+    return resp.text
+
+
+def _write_cache_meta(meta_path, meta):
+    tmp_path = meta_path + ".tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(meta, f)
+    os.replace(tmp_path, meta_path)
+
+
+def _is_stargazers_link(href):
+    return href is not None and href.endswith("/stargazers")
+
+
+def parse_trending_html(html):
+    """Parses a GitHub trending page into repo dicts, building a tree only for the repo articles."""
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=SoupStrainer("article"))
     trending = []
 
-    for repo in soup.select("article.Box-row"):
-        a = repo.select_one("h2.h3.lh-condensed a")
-        if not a or not a.get("href"):
+    for repo in soup.find_all("article", class_="Box-row"):
+        a = repo.h2.find("a", href=True) if repo.h2 else None
+        if not a:
             print("Skipped a repo due to missing link or href.")
             continue
 
@@ -18,17 +116,14 @@ def get_trending_repos():
         name = href.lstrip("/")
         url = "https://github.com" + href
 
-        desc_tag = repo.select_one("p.col-9.color-fg-muted.my-1.pr-4")
-        desc = desc_tag.text.strip() if desc_tag else ""
-
-        lang_tag = repo.select_one("span[itemprop='programmingLanguage']")
-        lang = lang_tag.text.strip() if lang_tag else ""
+        desc_tag = repo.find("p")
+        desc = desc_tag.get_text().strip() if desc_tag else ""
 
-        stars_tag = repo.select_one("a[href$='/stargazers']")
-        stars = stars_tag.text.strip() if stars_tag else "0"
+        lang_tag = repo.find("span", itemprop="programmingLanguage")
+        lang = lang_tag.get_text().strip() if lang_tag else ""
 
-        forks_tag = repo.select_one("a[href$='/network/members']")
-        forks = forks_tag.text.strip() if forks_tag else "0"
+        stars_tag = repo.find("a", href=_is_stargazers_link)
+        stars = stars_tag.get_text().strip() if stars_tag else "0"
 
         trending.append({
             "title": name,
@@ -38,7 +133,43 @@ def get_trending_repos():
             "stars": stars,
         })
 
+    return trending
+
+
+def get_trending_repos(language=None, since=None):
+    """Fetches one trending list, optionally for a language and a daily/weekly/monthly range."""
+    if since and since not in SINCE_OPTIONS:
+        raise ValueError(f"since must be one of {SINCE_OPTIONS}, got {since!r}")
+
+    url = TRENDING_URL + (f"/{language.lower()}" if language else "")
+    html = fetch_cached(url, params={"since": since} if since else None)
+    trending = parse_trending_html(html)
+
     print(f"Found {len(trending)} repos")
     if len(trending) == 0:
-        print("Here’s a sample article snippet:\n", soup.select_one("article.Box-row"))
+        print("Here’s a sample page snippet:\n", html[:2000])
     return trending
+
+
+def get_trending_repos_multi(languages=(None,), since_values=(None,), max_workers=6):
+    """
+    Fetches every language x since combination concurrently and merges them,
+    keeping the first occurrence of each repo URL.
+    """
+    variants = [(language, since) for language in languages for since in since_values]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(get_trending_repos, language, since) for language, since in variants]
+
+    merged = []
+    seen_urls = set()
+    for (language, since), future in zip(variants, futures):
+        try:
+            repos = future.result()
+        except Exception as e:
+            print(f"Error fetching trending repos for language={language}, since={since}: {e}")
+            continue
+        for repo in repos:
+            if repo["url"] not in seen_urls:
+                seen_urls.add(repo["url"])
+                merged.append(repo)
+    return merged
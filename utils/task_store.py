@@ -0,0 +1,230 @@
+import os
+import json
+import sqlite3
+import argparse
+
+DEFAULT_TASK_STORE_PATH = os.getenv("TASK_STORE_PATH", os.path.join(os.getcwd(), "tasks.db"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id TEXT PRIMARY KEY,
+    title TEXT,
+    domain TEXT,
+    difficulty TEXT,
+    task_type TEXT,
+    source TEXT,
+    source_url TEXT,
+    created_at TEXT,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_domain ON tasks(domain, created_at);
+CREATE INDEX IF NOT EXISTS idx_tasks_difficulty ON tasks(difficulty, created_at);
+CREATE INDEX IF NOT EXISTS idx_tasks_task_type ON tasks(task_type, created_at);
+CREATE INDEX IF NOT EXISTS idx_tasks_source ON tasks(source, created_at);
+CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks(created_at);
+
+CREATE TABLE IF NOT EXISTS task_skills (
+    task_id TEXT NOT NULL,
+    skill TEXT NOT NULL,
+    PRIMARY KEY (skill, task_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_task_skills_task ON task_skills(task_id);
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(task_id UNINDEXED, title, description);
+"""
+
+
+class TaskStore:
+    """
+    Embedded SQLite store for generated tasks, indexed on domain, difficulty,
+    task type, skills, source and creation time, with full-text search over
+    titles and descriptions.
+    """
+
+    def __init__(self, path=DEFAULT_TASK_STORE_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        try:
+            self.conn.executescript(FTS_SCHEMA)
+            self.has_fts = True
+        except sqlite3.OperationalError:
+            print("SQLite FTS5 is unavailable, falling back to LIKE search.")
+            self.has_fts = False
+        self.conn.commit()
+
+    def add_task(self, task, commit=True):
+        task_id = task.get("task_id")
+        if not task_id or "error_type" in task:
+            return False
+
+        mapping = task.get("real_world_mapping") or {}
+        source_url = mapping.get("source_url")
+        if source_url in (None, "N/A"):
+            source_url = mapping.get("source_job_url")
+
+        self.conn.execute(
+            "INSERT OR REPLACE INTO tasks (task_id, title, domain, difficulty, task_type, source, source_url, created_at, payload) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                task_id,
+                task.get("title"),
+                (task.get("domain") or "").lower(),
+                task.get("difficulty"),
+                task.get("task_type"),
+                mapping.get("source"),
+                source_url,
+                task.get("created_at"),
+                json.dumps(task, separators=(',', ':')),
+            ),
+        )
+
+        self.conn.execute("DELETE FROM task_skills WHERE task_id = ?", (task_id,))
+        skills = {s.get("name", "").strip().lower() for s in task.get("skills", []) if isinstance(s, dict)}
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO task_skills (task_id, skill) VALUES (?, ?)",
+            [(task_id, skill) for skill in skills if skill],
+        )
+
+        if self.has_fts:
+            self.conn.execute("DELETE FROM tasks_fts WHERE task_id = ?", (task_id,))
+            self.conn.execute(
+                "INSERT INTO tasks_fts (task_id, title, description) VALUES (?, ?, ?)",
+                (task_id, task.get("title", ""), task.get("description", "")),
+            )
+
+        if commit:
+            self.conn.commit()
+        return True
+
+    def add_tasks(self, tasks):
+        added = 0
+        with self.conn:
+            for task in tasks:
+                if self.add_task(task, commit=False):
+                    added += 1
+        return added
+
+    def write_repo_tasks(self, repo_result):
+        """Stores every generated task (easy/medium/hard) of a processed repo."""
+        tasks = repo_result.get("tasks") or {}
+        return self.add_tasks(t for t in tasks.values() if isinstance(t, dict))
+
+    def get_task(self, task_id):
+        row = self.conn.execute("SELECT payload FROM tasks WHERE task_id = ?", (task_id,)).fetchone()
+        return json.loads(row["payload"]) if row else None
+
+    def query(self, domain=None, difficulty=None, task_type=None, skill=None, source=None,
+              since=None, until=None, search=None, limit=50, offset=0):
+        """
+        Returns tasks matching every given filter, newest first.
+        `since`/`until` are ISO-8601 strings compared against created_at.
+        """
+        clauses = []
+        params = []
+        joins = ""
+
+        if skill:
+            joins += " JOIN task_skills s ON s.task_id = t.task_id AND s.skill = ?"
+            params.append(skill.strip().lower())
+        if search:
+            if self.has_fts:
+                joins += " JOIN tasks_fts f ON f.task_id = t.task_id AND tasks_fts MATCH ?"
+                params.append(search)
+            else:
+                clauses.append("t.payload LIKE ?")
+                params.append(f"%{search}%")
+
+        for column, value in (("domain", domain.lower() if domain else None), ("difficulty", difficulty),
+                              ("task_type", task_type), ("source", source)):
+            if value:
+                clauses.append(f"t.{column} = ?")
+                params.append(value)
+        if since:
+            clauses.append("t.created_at >= ?")
+            params.append(since)
+        if until:
+            clauses.append("t.created_at < ?")
+            params.append(until)
+
+        sql = f"SELECT t.payload FROM tasks t{joins}"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY t.created_at DESC LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+
+        return [json.loads(row["payload"]) for row in self.conn.execute(sql, params)]
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query the local generated-task store.")
+    parser.add_argument("--db", default=DEFAULT_TASK_STORE_PATH)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    query_parser = subparsers.add_parser("query", help="Filter and search stored tasks.")
+    query_parser.add_argument("--domain")
+    query_parser.add_argument("--difficulty", choices=["easy", "medium", "hard"])
+    query_parser.add_argument("--task-type")
+    query_parser.add_argument("--skill")
+    query_parser.add_argument("--source")
+    query_parser.add_argument("--since", help="ISO date, e.g. 2026-09-01")
+    query_parser.add_argument("--until", help="ISO date, exclusive")
+    query_parser.add_argument("--search", help="Full-text query over titles and descriptions")
+    query_parser.add_argument("--limit", type=int, default=20)
+    query_parser.add_argument("--page", type=int, default=1)
+    query_parser.add_argument("--full", action="store_true", help="Print full task JSON instead of a summary")
+
+    import_parser = subparsers.add_parser("import", help="Load tasks from trending reports or task JSON files.")
+    import_parser.add_argument("files", nargs="+")
+
+    subparsers.add_parser("count", help="Print the number of stored tasks.")
+
+    args = parser.parse_args(argv)
+
+    with TaskStore(args.db) as store:
+        if args.command == "count":
+            print(store.count())
+        elif args.command == "import":
+            for path in args.files:
+                with open(path, 'r') as f:
+                    data = json.load(f)
+                items = data if isinstance(data, list) else [data]
+                added = 0
+                for item in items:
+                    if "tasks" in item:
+                        added += store.write_repo_tasks(item)
+                    else:
+                        added += store.add_tasks([item])
+                print(f"Imported {added} tasks from {path}")
+        else:
+            tasks = store.query(
+                domain=args.domain, difficulty=args.difficulty, task_type=args.task_type,
+                skill=args.skill, source=args.source, since=args.since, until=args.until,
+                search=args.search, limit=args.limit, offset=(max(args.page, 1) - 1) * args.limit,
+            )
+            for task in tasks:
+                if args.full:
+                    print(json.dumps(task, indent=2))
+                else:
+                    print(f"{task.get('created_at', '')[:10]}  {task.get('difficulty', ''):6}  {task.get('domain', '')[:24]:24}  {task.get('title', '')}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,19 @@
 from utils.scraper import get_trending_repos
 from utils.processor import process_repositories
+from utils.domain_shards import DomainShardWriter
+from utils.task_store import TaskStore, DEFAULT_TASK_STORE_PATH
 import json
 from datetime import datetime
 import os
 import shutil
 
+DOMAIN_SHARDS_DIR = os.path.join(os.getcwd(), "domain_shards")
+
 def weekly_job():
     trending_repos = get_trending_repos()
     
-    results = process_repositories(trending_repos)
+    with DomainShardWriter(DOMAIN_SHARDS_DIR) as shard_writer, TaskStore(DEFAULT_TASK_STORE_PATH) as task_store:
+        results = process_repositories(trending_repos, sinks=(shard_writer, task_store))
     
     filename = f"trending_report_{datetime.now().strftime('%Y%m%d')}.json"
     filepath = os.path.join(os.getcwd(), filename)
@@ -17,8 +22,7 @@ def weekly_job():
         json.dump(results, f, indent=2)
     
     print(f"Weekly job completed. Report saved as {filename}")
-
-    process_report_by_domain(filepath)
+    print(f"Tasks sharded by domain into {DOMAIN_SHARDS_DIR} and stored in {DEFAULT_TASK_STORE_PATH}")
 
     send_email_report(filepath)
 
@@ -26,9 +30,9 @@ def send_email_report(filepath):
     print(f"Email report would be sent using: {filepath}")
     pass
 
-def process_report_by_domain(input_filepath):
+def process_report_by_domain(input_filepath, output_dir=DOMAIN_SHARDS_DIR):
     """
-    Processes the generated report, grouping tasks by domain into separate JSON files.
+    Re-shards an existing report, appending its tasks to the per-domain JSONL shards.
     """
     try:
         with open(input_filepath, 'r') as f:
@@ -40,27 +44,12 @@ def process_report_by_domain(input_filepath):
         print(f"Error: Could not decode JSON from {input_filepath}")
         return
 
-    for repo_data in data:
-        task = repo_data.get("task")
-        if not task:
-            continue
-
-        domain = task.get("domain", "misc")
-        domain = "".join(c for c in domain if c.isalnum() or c in (' ', '.', '_')).strip()
-        domain = domain.replace(" ", "_")
-
-        title = task.get("title", "untitled").replace(" ", "_").replace("/", "_")
-        
-        domain_dir = os.path.join(os.path.dirname(input_filepath), domain)
-        os.makedirs(domain_dir, exist_ok=True)
-
-        filename = f"{title}.json"
-        output_filepath = os.path.join(domain_dir, filename)
-
-        with open(output_filepath, 'w') as out_f:
-            json.dump(task, out_f, indent=2)
+    written = 0
+    with DomainShardWriter(output_dir) as shard_writer:
+        for repo_data in data:
+            written += shard_writer.write_repo_tasks(repo_data)
 
-    print("Tasks successfully grouped by domain.")
+    print(f"{written} tasks successfully grouped by domain.")
 
 if __name__ == "__main__":
-    weekly_job()
\ No newline at end of file
+    weekly_job()